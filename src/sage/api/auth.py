@@ -1,8 +1,13 @@
 """Authentication utilities for SAGE API."""
 
+import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
@@ -16,6 +21,7 @@ from sage.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
 def _derive_nextauth_key(secret: str) -> bytes:
     """Derive encryption key from NextAuth secret using HKDF.
 
@@ -23,6 +29,8 @@ def _derive_nextauth_key(secret: str) -> bytes:
     - Empty salt
     - Info string: "NextAuth.js Generated Encryption Key"
     - 32 bytes output (256 bits for A256GCM)
+
+    The result is cached per secret so each request skips the HKDF run.
     """
     hkdf = HKDF(
         algorithm=hashes.SHA256(),
@@ -33,9 +41,12 @@ def _derive_nextauth_key(secret: str) -> bytes:
     return hkdf.derive(secret.encode("utf-8"))
 
 
-@dataclass
+@dataclass(frozen=True)
 class CurrentUser:
-    """Authenticated user context."""
+    """Authenticated user context.
+
+    Frozen because verified users are cached and shared across requests.
+    """
 
     user_id: str  # From auth provider (sub claim)
     learner_id: str  # SAGE learner ID (linked)
@@ -43,6 +54,75 @@ class CurrentUser:
     name: Optional[str] = None
 
 
+class _TokenCache:
+    """Bounded LRU cache of verified tokens with a short TTL.
+
+    Keys are SHA-256 digests, so raw tokens are never held in memory.
+    Entries expire after the TTL or at the token's own ``exp`` claim,
+    whichever comes first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[CurrentUser, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(secret: str, token: str) -> bytes:
+        return hashlib.sha256(f"{secret}\0{token}".encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[CurrentUser]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def put(
+        self,
+        key: bytes,
+        user: CurrentUser,
+        exp: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        expires_at = (time.time() if now is None else now) + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_token_cache() -> _TokenCache:
+    """Get the shared verified-token cache, sized from settings.
+
+    Call ``_get_token_cache.cache_clear()`` alongside
+    ``get_settings.cache_clear()`` to drop cached tokens and re-read sizing.
+    """
+    settings = get_settings()
+    return _TokenCache(settings.jwt_cache_size, settings.jwt_cache_ttl)
+
+
 def _auth_error(detail: str) -> HTTPException:
     """Create a 401 authentication error."""
     return HTTPException(
@@ -97,24 +177,41 @@ class JWTBearer(HTTPBearer):
                 detail="Authentication not configured",
             )
 
+        cache = _get_token_cache()
+        cache_key = None
+        if cache.enabled:
+            cache_key = cache.key(self.settings.nextauth_secret, token)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Derive the encryption key using HKDF (same as NextAuth v4)
             derived_key = _derive_nextauth_key(self.settings.nextauth_secret)
             decrypted = jwe.decrypt(token, derived_key)
             payload = json.loads(decrypted)
 
-            # Validate required claims
+            # Validate required claims from the one decrypted payload
             if "sub" not in payload:
                 raise _auth_error("Token missing user ID")
             if "learner_id" not in payload:
                 raise _auth_error("Token missing learner ID")
-
-            return CurrentUser(
+            now = time.time()
+            exp = payload.get("exp")
+            if not isinstance(exp, (int, float)):
+                exp = None
+            elif exp <= now:
+                raise _auth_error("Token expired")
+
+            user = CurrentUser(
                 user_id=payload["sub"],
                 learner_id=payload["learner_id"],
                 email=payload.get("email"),
                 name=payload.get("name"),
             )
+            if cache_key is not None:
+                cache.put(cache_key, user, exp, now=now)
+            return user
 
         except jwe.JWEError as e:
             logger.error(f"JWE decryption failed: {e}")
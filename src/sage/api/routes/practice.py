@@ -181,8 +181,8 @@ async def start_practice(
     # Use the authenticated user's learner_id
     learner_id = user.learner_id
 
-    # Create practice scenario
-    scenario = PracticeScenario(
+    # Fields were already validated by PracticeStartRequest
+    scenario = PracticeScenario.model_construct(
         scenario_id=request.scenario_id,
         title=request.title,
         description=request.description,
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
         LLM_MODEL: Model name to use (default: grok-3-mini)
         SAGE_DB_PATH: Path to SQLite database (default: ./data/sage.db)
         SAGE_LOG_LEVEL: Logging level (default: INFO)
+        SAGE_JWT_CACHE_TTL: Seconds to cache verified tokens (default: 5)
+        SAGE_JWT_CACHE_SIZE: Max cached verified tokens (default: 10000)
     """
 
     model_config = SettingsConfigDict(
@@ -62,6 +64,16 @@ class Settings(BaseSettings):
         validation_alias="NEXTAUTH_SECRET",
         description="Secret for NextAuth.js JWT signing (required for auth)",
     )
+    jwt_cache_ttl: float = Field(
+        default=5.0,
+        validation_alias="SAGE_JWT_CACHE_TTL",
+        description="Seconds a verified token stays cached (0 disables the cache)",
+    )
+    jwt_cache_size: int = Field(
+        default=10000,
+        validation_alias="SAGE_JWT_CACHE_SIZE",
+        description="Maximum number of verified tokens kept in the cache",
+    )
 
     @property
     def log_level_int(self) -> int:
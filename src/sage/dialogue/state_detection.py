@@ -158,6 +158,13 @@ EXPLICIT_SIGNAL_PATTERNS: dict[str, list[str]] = {
 }
 
 
+# Compiled once at import; detection runs on every learner message.
+_COMPILED_SIGNAL_PATTERNS: dict[str, tuple[re.Pattern[str], ...]] = {
+    signal_type: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for signal_type, patterns in EXPLICIT_SIGNAL_PATTERNS.items()
+}
+
+
 def detect_explicit_signals(message: str) -> list[StateChangeSignal]:
     """Detect explicit state change signals in a message.
 
@@ -173,14 +180,14 @@ def detect_explicit_signals(message: str) -> list[StateChangeSignal]:
     signals = []
     message_lower = message.lower()
 
-    for signal_type, patterns in EXPLICIT_SIGNAL_PATTERNS.items():
+    for signal_type, patterns in _COMPILED_SIGNAL_PATTERNS.items():
         for pattern in patterns:
-            if re.search(pattern, message_lower, re.IGNORECASE):
+            if pattern.search(message_lower):
                 signals.append(
                     StateChangeSignal(
                         signal_type=signal_type,
                         confidence=0.8,  # High confidence for explicit signals
-                        evidence=f"Pattern match: {pattern}",
+                        evidence=f"Pattern match: {pattern.pattern}",
                         detected_at=datetime.utcnow(),
                     )
                 )
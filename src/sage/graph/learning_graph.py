@@ -20,7 +20,6 @@ from .models import (
     LearnerProfile,
     Message,
     Outcome,
-    OutcomeStatus,
     Proof,
     ProofExchange,
     Session,
@@ -59,6 +58,16 @@ class LearningGraph:
         """Access the underlying graph store."""
         return self._store
 
+    def transaction(self):
+        """Group several graph operations under a single commit.
+
+        Example:
+            with graph.transaction():
+                session = graph.create_session(Session(learner_id=learner.id))
+                graph.create_concept_obj(concept)
+        """
+        return self._store.transaction()
+
     # =========================================================================
     # Learner Operations
     # =========================================================================
@@ -94,9 +103,20 @@ class LearningGraph:
         """Get a learner by ID."""
         return self._store.get_learner(learner_id)
 
-    def update_learner(self, learner: Learner) -> None:
-        """Update an existing learner."""
-        self._store.update_learner(learner)
+    def update_learner(
+        self, learner: Learner, return_updated: bool = False
+    ) -> Optional[Learner]:
+        """Update an existing learner.
+
+        Args:
+            learner: The learner to persist.
+            return_updated: If True, return the stored learner as read back
+                by the UPDATE itself, saving a follow-up get_learner().
+
+        Returns:
+            The stored learner when return_updated is set, otherwise None.
+        """
+        return self._store.update_learner(learner, return_updated=return_updated)
 
     def get_learner_state(self, learner_id: str) -> Optional[LearnerState]:
         """Get complete learner state for session continuity.
@@ -135,10 +155,7 @@ class LearningGraph:
         self._store.create_outcome(outcome)
 
         if set_active:
-            learner = self._store.get_learner(learner_id)
-            if learner:
-                learner.active_outcome_id = outcome.id
-                self._store.update_learner(learner)
+            self._store.set_active_outcome(learner_id, outcome.id)
 
         return outcome
 
@@ -157,13 +174,13 @@ class LearningGraph:
         """Update an existing outcome."""
         self._store.update_outcome(outcome)
 
-    def mark_achieved(self, outcome_id: str) -> None:
-        """Mark an outcome as achieved."""
-        outcome = self._store.get_outcome(outcome_id)
-        if outcome:
-            outcome.status = OutcomeStatus.ACHIEVED
-            outcome.achieved_at = datetime.utcnow()
-            self._store.update_outcome(outcome)
+    def mark_achieved(self, outcome_id: str) -> Optional[Outcome]:
+        """Mark an outcome as achieved.
+
+        Returns:
+            The updated outcome, or None if it doesn't exist.
+        """
+        return self._store.mark_outcome_achieved(outcome_id, datetime.utcnow())
 
     def get_outcome_progress(self, outcome_id: str) -> dict:
         """Get progress on an outcome including concepts and proofs."""
@@ -233,13 +250,13 @@ class LearningGraph:
             concept.status = ConceptStatus.TEACHING
             self._store.update_concept(concept)
 
-    def mark_concept_understood(self, concept_id: str) -> None:
-        """Mark a concept as understood."""
-        concept = self._store.get_concept(concept_id)
-        if concept:
-            concept.status = ConceptStatus.UNDERSTOOD
-            concept.understood_at = datetime.utcnow()
-            self._store.update_concept(concept)
+    def mark_concept_understood(self, concept_id: str) -> Optional[Concept]:
+        """Mark a concept as understood.
+
+        Returns:
+            The updated concept, or None if it doesn't exist.
+        """
+        return self._store.mark_concept_understood(concept_id, datetime.utcnow())
 
     # =========================================================================
     # Proof Operations
@@ -294,10 +311,7 @@ class LearningGraph:
         self.mark_concept_understood(concept_id)
 
         # Update learner stats
-        learner = self._store.get_learner(learner_id)
-        if learner:
-            learner.total_proofs += 1
-            self._store.update_learner(learner)
+        self._store.increment_learner_proofs(learner_id)
 
         return proof
 
@@ -341,11 +355,7 @@ class LearningGraph:
         self._store.create_session(session)
 
         # Update learner stats
-        learner = self._store.get_learner(learner_id)
-        if learner:
-            learner.total_sessions += 1
-            learner.last_session_at = session.started_at
-            self._store.update_learner(learner)
+        self._store.increment_learner_sessions(learner_id, session.started_at)
 
         return session
 
@@ -354,18 +364,22 @@ class LearningGraph:
         session: Session,
         summary: Optional[str] = None,
         ending_state: Optional[SessionEndingState] = None,
-    ) -> None:
+    ) -> Session:
         """End a learning session.
 
         Args:
             session: The session to end.
             summary: Optional summary of what happened.
             ending_state: Optional state for continuity.
+
+        Returns:
+            The ended session.
         """
         session.ended_at = datetime.utcnow()
         session.summary = summary
         session.ending_state = ending_state
         self._store.update_session(session)
+        return session
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
@@ -4,7 +4,9 @@ Provides persistent storage for all graph nodes and edges with JSON field suppor
 """
 
 import json
+import operator
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
@@ -42,6 +44,21 @@ from .models import (
 T = TypeVar("T", bound=BaseModel)
 
 
+# Enum columns bind straight through sqlite3's adapter table instead of
+# going through per-call `.value` lookups at every INSERT/UPDATE site.
+for _enum in (
+    ApplicationStatus,
+    ConceptStatus,
+    DemoType,
+    EdgeType,
+    OutcomeStatus,
+    ScenarioDifficulty,
+    SessionType,
+):
+    sqlite3.register_adapter(_enum, operator.attrgetter("value"))
+del _enum
+
+
 # =============================================================================
 # Schema Definition
 # =============================================================================
@@ -263,6 +280,9 @@ class GraphStore:
         self.db_path = str(db_path)
         self._is_memory = self.db_path == ":memory:"
         self._persistent_conn: Optional[sqlite3.Connection] = None
+        # Per-thread so a transaction on one thread never captures writes
+        # made by other threads sharing this store (e.g. API request workers).
+        self._local = threading.local()
 
         # For in-memory DBs, create persistent connection immediately
         if self._is_memory:
@@ -284,8 +304,13 @@ class GraphStore:
 
         For in-memory databases, returns the persistent connection.
         For file-based databases, creates a new connection each time.
+        Inside transaction() on the same thread, returns the transaction's
+        connection and leaves the commit to the transaction.
         """
-        if self._is_memory:
+        transaction_conn = getattr(self._local, "transaction_conn", None)
+        if transaction_conn is not None:
+            yield transaction_conn
+        elif self._is_memory:
             # In-memory: use persistent connection, don't close it
             yield self._persistent_conn
             self._persistent_conn.commit()
@@ -302,6 +327,38 @@ class GraphStore:
             finally:
                 conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """Run several operations on one connection with a single commit.
+
+        Every store call made inside the block reuses the same connection,
+        so a batch of inserts costs one commit instead of one per call.
+        Rolls back everything if the block raises. Nested calls join the
+        outer transaction. The transaction is scoped to the calling thread;
+        other threads using this store keep their own connections.
+        """
+        transaction_conn = getattr(self._local, "transaction_conn", None)
+        if transaction_conn is not None:
+            yield transaction_conn
+            return
+
+        if self._is_memory:
+            conn = self._persistent_conn
+        else:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+        self._local.transaction_conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.transaction_conn = None
+            if not self._is_memory:
+                conn.close()
+
     # =========================================================================
     # Learner Operations
     # =========================================================================
@@ -342,10 +399,22 @@ class GraphStore:
                 return None
             return self._row_to_learner(row)
 
-    def update_learner(self, learner: Learner) -> None:
-        """Update an existing learner."""
+    def update_learner(
+        self, learner: Learner, return_updated: bool = False
+    ) -> Optional[Learner]:
+        """Update an existing learner.
+
+        Args:
+            learner: The learner to persist.
+            return_updated: If True, read the stored row back via RETURNING
+                in the same statement and return it.
+
+        Returns:
+            The stored learner when return_updated is set, otherwise None.
+        """
+        returning = " RETURNING *" if return_updated else ""
         with self.connection() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE learners SET
                     profile = ?,
@@ -357,7 +426,8 @@ class GraphStore:
                     total_sessions = ?,
                     total_proofs = ?
                 WHERE id = ?
-                """,
+                """
+                + returning,
                 (
                     learner.profile.model_dump_json(),
                     learner.preferences.model_dump_json(),
@@ -370,6 +440,39 @@ class GraphStore:
                     learner.id,
                 ),
             )
+            if not return_updated:
+                return None
+            row = cursor.fetchone()
+            return self._row_to_learner(row) if row else None
+
+    def set_active_outcome(self, learner_id: str, outcome_id: Optional[str]) -> None:
+        """Point a learner at a new active outcome."""
+        with self.connection() as conn:
+            conn.execute(
+                "UPDATE learners SET active_outcome_id = ? WHERE id = ?",
+                (outcome_id, learner_id),
+            )
+
+    def increment_learner_sessions(self, learner_id: str, session_at: datetime) -> None:
+        """Increment the session counter and record when the session started."""
+        with self.connection() as conn:
+            conn.execute(
+                """
+                UPDATE learners SET
+                    total_sessions = total_sessions + 1,
+                    last_session_at = ?
+                WHERE id = ?
+                """,
+                (session_at.isoformat(), learner_id),
+            )
+
+    def increment_learner_proofs(self, learner_id: str) -> None:
+        """Increment the proof counter for a learner."""
+        with self.connection() as conn:
+            conn.execute(
+                "UPDATE learners SET total_proofs = total_proofs + 1 WHERE id = ?",
+                (learner_id,),
+            )
 
     def _row_to_learner(self, row: sqlite3.Row) -> Learner:
         """Convert a database row to a Learner model."""
@@ -408,7 +511,7 @@ class GraphStore:
                     outcome.clarified_goal,
                     outcome.motivation,
                     outcome.success_criteria,
-                    outcome.status.value,
+                    outcome.status,
                     json.dumps(outcome.territory) if outcome.territory else None,
                     outcome.created_at.isoformat(),
                     outcome.achieved_at.isoformat() if outcome.achieved_at else None,
@@ -465,7 +568,7 @@ class GraphStore:
                     outcome.clarified_goal,
                     outcome.motivation,
                     outcome.success_criteria,
-                    outcome.status.value,
+                    outcome.status,
                     json.dumps(outcome.territory) if outcome.territory else None,
                     outcome.achieved_at.isoformat() if outcome.achieved_at else None,
                     outcome.last_worked_on.isoformat(),
@@ -473,6 +576,23 @@ class GraphStore:
                 ),
             )
 
+    def mark_outcome_achieved(
+        self, outcome_id: str, achieved_at: datetime
+    ) -> Optional[Outcome]:
+        """Mark an outcome achieved and return the updated row."""
+        with self.connection() as conn:
+            row = conn.execute(
+                """
+                UPDATE outcomes SET status = ?, achieved_at = ?
+                WHERE id = ?
+                RETURNING *
+                """,
+                (OutcomeStatus.ACHIEVED, achieved_at.isoformat(), outcome_id),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._row_to_outcome(row)
+
     def _row_to_outcome(self, row: sqlite3.Row) -> Outcome:
         """Convert a database row to an Outcome model."""
         return Outcome(
@@ -511,7 +631,7 @@ class GraphStore:
                     concept.display_name,
                     concept.description,
                     concept.discovered_from,
-                    concept.status.value,
+                    concept.status,
                     concept.summary,
                     concept.times_discussed,
                     concept.discovered_at.isoformat(),
@@ -567,7 +687,7 @@ class GraphStore:
                     concept.name,
                     concept.display_name,
                     concept.description,
-                    concept.status.value,
+                    concept.status,
                     concept.summary,
                     concept.times_discussed,
                     concept.understood_at.isoformat() if concept.understood_at else None,
@@ -575,6 +695,23 @@ class GraphStore:
                 ),
             )
 
+    def mark_concept_understood(
+        self, concept_id: str, understood_at: datetime
+    ) -> Optional[Concept]:
+        """Mark a concept understood and return the updated row."""
+        with self.connection() as conn:
+            row = conn.execute(
+                """
+                UPDATE concepts SET status = ?, understood_at = ?
+                WHERE id = ?
+                RETURNING *
+                """,
+                (ConceptStatus.UNDERSTOOD, understood_at.isoformat(), concept_id),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._row_to_concept(row)
+
     def _row_to_concept(self, row: sqlite3.Row) -> Concept:
         """Convert a database row to a Concept model."""
         return Concept(
@@ -610,7 +747,7 @@ class GraphStore:
                     proof.learner_id,
                     proof.concept_id,
                     proof.session_id,
-                    proof.demonstration_type.value,
+                    proof.demonstration_type,
                     proof.evidence,
                     proof.confidence,
                     proof.exchange.model_dump_json(),
@@ -690,7 +827,7 @@ class GraphStore:
                     json.dumps(session.proofs_earned),
                     json.dumps(session.connections_found),
                     session.ending_state.model_dump_json() if session.ending_state else None,
-                    session.session_type.value,
+                    session.session_type,
                     session.practice_scenario.model_dump_json() if session.practice_scenario else None,
                     session.practice_feedback.model_dump_json() if session.practice_feedback else None,
                 ),
@@ -751,7 +888,7 @@ class GraphStore:
                     json.dumps(session.proofs_earned),
                     json.dumps(session.connections_found),
                     session.ending_state.model_dump_json() if session.ending_state else None,
-                    session.session_type.value,
+                    session.session_type,
                     session.practice_scenario.model_dump_json() if session.practice_scenario else None,
                     session.practice_feedback.model_dump_json() if session.practice_feedback else None,
                     session.id,
@@ -827,7 +964,7 @@ class GraphStore:
                     event.context,
                     event.planned_date.isoformat() if event.planned_date else None,
                     event.stakes,
-                    event.status.value,
+                    event.status,
                     event.created_at.isoformat(),
                     event.followup_session_id,
                     event.followed_up_at.isoformat() if event.followed_up_at else None,
@@ -898,7 +1035,7 @@ class GraphStore:
                 WHERE id = ?
                 """,
                 (
-                    event.status.value,
+                    event.status,
                     event.followup_session_id,
                     event.followed_up_at.isoformat() if event.followed_up_at else None,
                     event.outcome_result,
@@ -952,7 +1089,7 @@ class GraphStore:
                     edge.from_type,
                     edge.to_id,
                     edge.to_type,
-                    edge.edge_type.value,
+                    edge.edge_type,
                     json.dumps(edge.metadata),
                     edge.created_at.isoformat(),
                 ),
@@ -1132,7 +1269,7 @@ class GraphStore:
                     scenario.sage_role,
                     scenario.user_role,
                     scenario.category,
-                    scenario.difficulty.value,
+                    scenario.difficulty,
                     json.dumps(scenario.related_concepts),
                     1 if scenario.is_preset else 0,
                     scenario.learner_id,
@@ -1211,7 +1348,7 @@ class GraphStore:
                     scenario.sage_role,
                     scenario.user_role,
                     scenario.category,
-                    scenario.difficulty.value,
+                    scenario.difficulty,
                     json.dumps(scenario.related_concepts),
                     scenario.times_used,
                     scenario.id,
@@ -214,6 +214,14 @@ INTENT_SCHEMAS: dict[str, dict[str, Any]] = {
 }
 
 
+# Required-field sets per intent, built once so completeness checks are a
+# set difference rather than a per-call scan of the schema lists.
+_INTENT_REQUIRED: dict[str, frozenset[str]] = {
+    intent: frozenset(schema.get("required", []))
+    for intent, schema in INTENT_SCHEMAS.items()
+}
+
+
 def _build_extraction_prompt(text: str, pending_context: dict[str, Any] | None) -> str:
     """Build the extraction prompt for the LLM."""
     schemas_desc = []
@@ -292,9 +300,11 @@ def _build_extracted_intent(
     intent = result.get("intent", "unknown")
     merged_data = {**(pending_context or {}), **result.get("data", {})}
 
-    schema = INTENT_SCHEMAS.get(intent, {})
-    required = schema.get("required", [])
-    missing = [f for f in required if not merged_data.get(f)]
+    missing: list[str] = []
+    required = _INTENT_REQUIRED.get(intent)
+    if required:
+        present = {name for name, value in merged_data.items() if value}
+        missing = sorted(required - present)
 
     return ExtractedIntent(
         intent=intent,
@@ -4,9 +4,13 @@ Converts any input type (form, voice, chat) to a normalized semantic
 intent structure for consistent processing by the SAGE orchestrator.
 """
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 
 class InputModality(Enum):
@@ -18,7 +22,7 @@ class InputModality(Enum):
     HYBRID = "hybrid"  # Mixed modality (e.g., voice + form prefill)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedInput:
     """Unified input regardless of source modality.
 
@@ -48,45 +52,80 @@ class NormalizedInput:
     """Original input for context and debugging."""
 
 
-FORM_SCHEMAS: dict[str, dict[str, Any]] = {
-    "session_check_in": {
-        "required": [],  # All fields optional for flexibility
-        "optional": ["timeAvailable", "energyLevel", "mindset"],
-        "validators": {
+def _is_percentage(value: Any) -> bool:
+    """Shared range check for 0-100 fields (energy level, confidence)."""
+    return isinstance(value, (int, float)) and 0 <= value <= 100
+
+
+# Read-only all the way down (field lists are tuples): the compiled tables
+# below are derived from this at import, so runtime edits would otherwise
+# silently diverge from what validation uses.
+FORM_SCHEMAS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "session_check_in": MappingProxyType({
+        "required": (),  # All fields optional for flexibility
+        "optional": ("timeAvailable", "energyLevel", "mindset"),
+        "validators": MappingProxyType({
             "timeAvailable": lambda v: v in ("quick", "focused", "deep"),
-            "energyLevel": lambda v: isinstance(v, (int, float)) and 0 <= v <= 100,
-        },
-    },
-    "practice_setup": {
-        "required": ["scenario_type"],
-        "optional": ["difficulty", "context", "focus_area"],
-        "validators": {
+            "energyLevel": _is_percentage,
+        }),
+    }),
+    "practice_setup": MappingProxyType({
+        "required": ("scenario_type",),
+        "optional": ("difficulty", "context", "focus_area"),
+        "validators": MappingProxyType({
             "difficulty": lambda v: v in ("easy", "medium", "hard"),
-        },
-    },
-    "verification": {
-        "required": ["answer"],
-        "optional": ["confidence", "notes"],
-        "validators": {
-            "confidence": lambda v: isinstance(v, (int, float)) and 0 <= v <= 100,
-        },
-    },
-    "outcome_discovery": {
-        "required": [],
-        "optional": ["goal", "context", "timeline"],
-        "validators": {},
-    },
-    "application_event": {
-        "required": [],
-        "optional": ["context", "planned_date", "stakes"],
-        "validators": {
+        }),
+    }),
+    "verification": MappingProxyType({
+        "required": ("answer",),
+        "optional": ("confidence", "notes"),
+        "validators": MappingProxyType({
+            "confidence": _is_percentage,
+        }),
+    }),
+    "outcome_discovery": MappingProxyType({
+        "required": (),
+        "optional": ("goal", "context", "timeline"),
+        "validators": MappingProxyType({}),
+    }),
+    "application_event": MappingProxyType({
+        "required": (),
+        "optional": ("context", "planned_date", "stakes"),
+        "validators": MappingProxyType({
             "stakes": lambda v: v in ("low", "medium", "high"),
-        },
-    },
-}
+        }),
+    }),
+})
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledSchema:
+    """Import-time view of a FORM_SCHEMAS entry used on the validation path."""
 
+    required: frozenset[str]
+    fields: frozenset[str]
+    validators: tuple[tuple[str, Callable[[Any], bool]], ...]  # (field, validator) pairs
 
-_DEFAULT_SCHEMA: dict[str, Any] = {"required": [], "optional": [], "validators": {}}
+
+def _compile_schema(schema: Mapping[str, Any]) -> _CompiledSchema:
+    required = schema.get("required", ())
+    return _CompiledSchema(
+        required=frozenset(required),
+        fields=frozenset(chain(required, schema.get("optional", ()))),
+        validators=tuple(schema.get("validators", {}).items()),
+    )
+
+
+# Built once at import so validation is set arithmetic plus attribute reads
+# instead of rebuilding and scanning the schema lists per call.
+_COMPILED_SCHEMAS: dict[str, _CompiledSchema] = {
+    intent: _compile_schema(schema) for intent, schema in FORM_SCHEMAS.items()
+}
+_EMPTY_COMPILED_SCHEMA = _CompiledSchema(frozenset(), frozenset(), ())
+
+FORM_FIELDS: dict[str, frozenset[str]] = {
+    intent: compiled.fields for intent, compiled in _COMPILED_SCHEMAS.items()
+}
 
 _FORM_ID_TO_INTENT: list[tuple[tuple[str, ...], str]] = [
     (("check_in", "check-in"), "session_check_in"),
@@ -97,17 +136,28 @@ _FORM_ID_TO_INTENT: list[tuple[tuple[str, ...], str]] = [
 ]
 
 
+# The table above as one anchored alternation. Each branch looks ahead for any
+# of its keywords and captures an empty group named after the intent, so the
+# first listed intent still wins when a form ID contains several keywords.
+_FORM_ID_PATTERN = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{intent}>)"
+        for keywords, intent in _FORM_ID_TO_INTENT
+    ),
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=512)
 def _infer_intent_from_form_id(form_id: str) -> str:
     """Infer semantic intent from form ID.
 
     Maps form IDs (like 'check-in-abc123') to semantic intents
-    (like 'session_check_in').
+    (like 'session_check_in'). Results are memoized since the same
+    form IDs recur across submissions.
     """
-    form_id_lower = form_id.lower()
-    for keywords, intent in _FORM_ID_TO_INTENT:
-        if any(keyword in form_id_lower for keyword in keywords):
-            return intent
-    return "generic_form"
+    match = _FORM_ID_PATTERN.match(form_id.lower())
+    return match.lastgroup if match else "generic_form"
 
 
 def _validate_against_schema(
@@ -116,29 +166,41 @@ def _validate_against_schema(
 ) -> tuple[list[str], list[str]]:
     """Validate data against the schema for an intent.
 
+    Validation errors are reported in the schema's validator order, not
+    the order fields were submitted, so the same payload always yields
+    the same error list.
+
     Returns:
         Tuple of (missing_fields, validation_errors)
     """
-    schema = FORM_SCHEMAS.get(intent, _DEFAULT_SCHEMA)
+    schema = _COMPILED_SCHEMAS.get(intent, _EMPTY_COMPILED_SCHEMA)
+    if not data:
+        # Nothing to validate; every required field is missing
+        return sorted(schema.required), []
+
     missing_fields = []
     validation_errors = []
 
-    for field_name in schema.get("required", []):
-        if field_name not in data or data[field_name] is None:
-            missing_fields.append(field_name)
+    if schema.required:
+        present = {name for name, value in data.items() if value is not None}
+        missing_fields = sorted(schema.required - present)
 
-    validators = schema.get("validators", {})
-    for field_name, value in data.items():
-        if field_name in validators and value is not None:
-            try:
-                if not validators[field_name](value):
-                    validation_errors.append(f"Invalid value for {field_name}: {value}")
-            except Exception as e:
-                validation_errors.append(f"Validation error for {field_name}: {e}")
+    for field_name, validator in schema.validators:
+        value = data.get(field_name)
+        if value is None:
+            continue
+        try:
+            if not validator(value):
+                validation_errors.append(f"Invalid value for {field_name}: {value}")
+        except Exception as e:
+            validation_errors.append(f"Validation error for {field_name}: {e}")
 
     return missing_fields, validation_errors
 
 
+_FORM_RAW_PREFIX = "form:"
+
+
 class InputNormalizer:
     """Converts any input to NormalizedInput.
 
@@ -169,7 +231,7 @@ class InputNormalizer:
             missing_fields=missing_fields,
             validation_errors=validation_errors,
             source_modality=InputModality.FORM,
-            raw_input=f"form:{form_id}",
+            raw_input=_FORM_RAW_PREFIX + form_id,
         )
 
     def _normalize_unstructured(
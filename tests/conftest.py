@@ -1,12 +1,19 @@
 """Common test fixtures for SAGE tests."""
 
 import json
+import shutil
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable
+
 import pytest
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import hashes
 from jose.jwe import encrypt as jwe_encrypt
 from fastapi.testclient import TestClient
 
+from sage.api.auth import JWTBearer, _get_token_cache
 from sage.api.deps import get_graph
 from sage.api.main import app
 from sage.core.config import get_settings
@@ -24,6 +31,7 @@ from sage.graph.models import (
 TEST_SECRET = "test-secret-key-for-testing-only"
 
 
+@lru_cache
 def _derive_test_key(secret: str) -> bytes:
     """Derive encryption key using HKDF (matches NextAuth v4)."""
     hkdf = HKDF(
@@ -35,8 +43,13 @@ def _derive_test_key(secret: str) -> bytes:
     return hkdf.derive(secret.encode("utf-8"))
 
 
+@lru_cache(maxsize=256)
 def create_test_token(user_id: str, learner_id: str) -> str:
-    """Create a JWE encrypted token for testing (matches NextAuth format)."""
+    """Create a JWE encrypted token for testing (matches NextAuth format).
+
+    Tokens are deterministic per (user_id, learner_id) apart from the random
+    IV, so they are memoized to skip repeated HKDF + JWE work across fixtures.
+    """
     payload = {
         "sub": user_id,
         "learner_id": learner_id,
@@ -52,10 +65,34 @@ def create_test_token(user_id: str, learner_id: str) -> str:
     ).decode("utf-8")
 
 
+def make_llm_response(content: str) -> SimpleNamespace:
+    """Create a plain stand-in for an OpenAI chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def measure_p95_latency_ms(func: Callable, iterations: int) -> float:
+    """Measure P95 latency of a function in milliseconds."""
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[int(len(times) * 0.95)]
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory):
+    """Schema-initialized, seeded database file built once per session."""
+    db_path = tmp_path_factory.mktemp("template") / "template.db"
+    LearningGraph(str(db_path))
+    return db_path
+
+
 @pytest.fixture
-def test_graph(tmp_path):
-    """Create test graph with temp database."""
+def test_graph(tmp_path, template_db):
+    """Create test graph with temp database copied from the session template."""
     db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db, db_path)
     return LearningGraph(str(db_path))
 
 
@@ -63,21 +100,36 @@ def test_graph(tmp_path):
 def mock_settings(monkeypatch):
     """Mock settings for testing."""
     monkeypatch.setenv("NEXTAUTH_SECRET", TEST_SECRET)
-    # Clear cached settings to pick up new env var
+    # Clear cached settings (and the token cache sized from them) to pick up new env var
     get_settings.cache_clear()
+    _get_token_cache.cache_clear()
     yield
     get_settings.cache_clear()
+    _get_token_cache.cache_clear()
+
+
+@pytest.fixture
+def bearer(mock_settings):
+    """JWTBearer with a fresh token cache (mock_settings clears it)."""
+    return JWTBearer()
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """Single TestClient reused by every test; per-test state lives in overrides."""
+    return TestClient(app)
 
 
 @pytest.fixture
-def client(test_graph, mock_settings):
+def client(shared_client, test_graph, mock_settings):
     """Create test client with overridden dependencies."""
 
     def override_get_graph():
         yield test_graph
 
     app.dependency_overrides[get_graph] = override_get_graph
-    yield TestClient(app)
+    shared_client.cookies.clear()
+    yield shared_client
     app.dependency_overrides.clear()
 
 
@@ -110,19 +162,18 @@ def test_session(test_graph, test_learner):
     return test_graph.create_session(session)
 
 
-@pytest.fixture
-def auth_headers(test_learner):
-    """Create auth headers with valid JWT token."""
-    token = create_test_token(test_learner.id, test_learner.id)
-    return {"Authorization": f"Bearer {token}"}
-
-
 @pytest.fixture
 def auth_token(test_learner):
     """Create a JWT token for testing."""
     return create_test_token(test_learner.id, test_learner.id)
 
 
+@pytest.fixture
+def auth_headers(auth_token):
+    """Create auth headers with valid JWT token."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
 @pytest.fixture
 def other_learner(test_graph):
     """Create a second learner for ownership tests."""
@@ -211,23 +211,16 @@ class TestWebSocketProtocolExtension:
         assert "high" in result
         assert "excited about the topic" in result
 
-    def test_form_data_to_message_check_in_low_energy(self):
-        """Test _form_data_to_message with low energy."""
+    @pytest.mark.parametrize(
+        "form_id,energy,expected",
+        [("session_check_in", 20, "low"), ("check_in_form", 50, "medium")],
+    )
+    def test_form_data_to_message_check_in_energy(self, form_id, energy, expected):
+        """Test _form_data_to_message describes each energy band."""
         from sage.api.routes.chat import _form_data_to_message
 
-        result = _form_data_to_message("session_check_in", {
-            "energyLevel": 20,
-        })
-        assert "low" in result
-
-    def test_form_data_to_message_check_in_medium_energy(self):
-        """Test _form_data_to_message with medium energy."""
-        from sage.api.routes.chat import _form_data_to_message
-
-        result = _form_data_to_message("check_in_form", {
-            "energyLevel": 50,
-        })
-        assert "medium" in result
+        result = _form_data_to_message(form_id, {"energyLevel": energy})
+        assert expected in result
 
     def test_form_data_to_message_verification(self):
         """Test _form_data_to_message with verification form."""
@@ -500,3 +493,97 @@ class TestFormFieldUpdates:
 
         # SAGEResponse doesn't have form_field_updates, should be None
         assert result["form_field_updates"] is None
+
+
+class TestTokenCache:
+    """Tests for the verified-token cache in sage.api.auth."""
+
+    def test_repeat_verification_skips_decrypt(self, bearer, monkeypatch):
+        """A second verification of the same token is served from the cache."""
+        from sage.api import auth
+
+        token = create_test_token("user-1", "learner-1")
+        first = bearer._verify_token(token)
+
+        def fail_decrypt(*args, **kwargs):
+            raise AssertionError("decrypt should not be called on a cache hit")
+
+        monkeypatch.setattr(auth.jwe, "decrypt", fail_decrypt)
+        second = bearer._verify_token(token)
+
+        assert second == first
+        assert second.learner_id == "learner-1"
+
+    def test_cached_user_is_immutable(self, bearer):
+        """Users served from the cache cannot be mutated by a handler."""
+        from dataclasses import FrozenInstanceError
+
+        user = bearer._verify_token(create_test_token("user-1", "learner-1"))
+
+        with pytest.raises(FrozenInstanceError):
+            user.learner_id = "someone-else"
+        assert bearer._verify_token(create_test_token("user-1", "learner-1")).learner_id == "learner-1"
+
+    def test_invalid_token_not_cached(self, bearer):
+        """Failed verifications are not cached."""
+        from fastapi import HTTPException
+
+        from sage.api.auth import _get_token_cache
+
+        with pytest.raises(HTTPException):
+            bearer._verify_token("not-a-token")
+        assert len(_get_token_cache()) == 0
+
+    def test_expired_token_rejected(self, bearer):
+        """Tokens past their exp claim fail verification."""
+        import json
+        import time
+
+        from fastapi import HTTPException
+        from jose.jwe import encrypt as jwe_encrypt
+
+        from tests.conftest import TEST_SECRET, _derive_test_key
+
+        payload = {"sub": "user-1", "learner_id": "learner-1", "exp": time.time() - 10}
+        token = jwe_encrypt(
+            json.dumps(payload).encode("utf-8"), _derive_test_key(TEST_SECRET)
+        ).decode("utf-8")
+
+        with pytest.raises(HTTPException) as exc_info:
+            bearer._verify_token(token)
+        assert exc_info.value.detail == "Token expired"
+
+    def test_derived_key_is_cached(self):
+        """HKDF key derivation runs once per secret."""
+        from sage.api.auth import _derive_nextauth_key
+
+        assert _derive_nextauth_key("secret-a") is _derive_nextauth_key("secret-a")
+        assert _derive_nextauth_key("secret-a") != _derive_nextauth_key("secret-b")
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache holds at most maxsize entries."""
+        from sage.api.auth import CurrentUser, _TokenCache
+
+        cache = _TokenCache(maxsize=2, ttl=60)
+        for i in range(3):
+            cache.put(bytes([i]), CurrentUser(user_id=str(i), learner_id=str(i)))
+
+        assert cache.get(bytes([0])) is None
+        assert cache.get(bytes([2])).user_id == "2"
+
+    def test_cache_honors_token_expiry(self):
+        """Entries never outlive the token's exp claim."""
+        import time
+
+        from sage.api.auth import CurrentUser, _TokenCache
+
+        cache = _TokenCache(maxsize=2, ttl=60)
+        cache.put(b"k", CurrentUser(user_id="u", learner_id="l"), exp=time.time() - 1)
+
+        assert cache.get(b"k") is None
+
+    def test_zero_ttl_disables_cache(self):
+        """A TTL of zero turns the cache off."""
+        from sage.api.auth import _TokenCache
+
+        assert _TokenCache(maxsize=10, ttl=0).enabled is False
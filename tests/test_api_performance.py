@@ -0,0 +1,57 @@
+"""Performance tests for API authentication.
+
+Tests that bearer-token verification and authenticated requests meet
+latency targets. These are wall-clock checks, so they are opt-in:
+run them with ``SAGE_RUN_PERF_TESTS=1 pytest -m performance``.
+"""
+
+import os
+
+import pytest
+
+from tests.conftest import create_test_token, measure_p95_latency_ms
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(
+        not os.environ.get("SAGE_RUN_PERF_TESTS"),
+        reason="set SAGE_RUN_PERF_TESTS=1 to run API latency checks",
+    ),
+]
+
+
+class TestTokenVerificationLatency:
+    """Tests for bearer-token verification latency."""
+
+    def test_cached_verification_under_1ms(self, bearer):
+        """Cached token verification completes under 1ms."""
+        token = create_test_token("user-1", "learner-1")
+        bearer._verify_token(token)
+
+        p95 = measure_p95_latency_ms(lambda: bearer._verify_token(token), 200)
+        assert p95 < 1, f"P95 cached verification {p95:.3f}ms exceeds 1ms target"
+
+    def test_uncached_verification_under_10ms(self, bearer):
+        """Full JWE decrypt and claim validation completes under 10ms."""
+        from sage.api.auth import _get_token_cache
+
+        token = create_test_token("user-1", "learner-1")
+
+        def verify_cold():
+            _get_token_cache().clear()
+            bearer._verify_token(token)
+
+        p95 = measure_p95_latency_ms(verify_cold, 50)
+        assert p95 < 10, f"P95 uncached verification {p95:.2f}ms exceeds 10ms target"
+
+
+class TestAuthenticatedRequestLatency:
+    """Tests for end-to-end authenticated request latency."""
+
+    def test_get_learner_under_50ms(self, client, test_learner, auth_headers):
+        """Authenticated learner lookup completes under 50ms."""
+        url = f"/api/learners/{test_learner.id}"
+        assert client.get(url, headers=auth_headers).status_code == 200
+
+        p95 = measure_p95_latency_ms(lambda: client.get(url, headers=auth_headers), 30)
+        assert p95 < 50, f"P95 authenticated request {p95:.2f}ms exceeds 50ms target"
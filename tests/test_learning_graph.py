@@ -52,11 +52,19 @@ class TestLearnerOperations:
     def test_update_learner(self, graph):
         learner = graph.get_or_create_learner()
         learner.profile.name = "Updated Name"
-        graph.update_learner(learner)
+        retrieved = graph.update_learner(learner, return_updated=True)
 
-        retrieved = graph.get_learner(learner.id)
         assert retrieved.profile.name == "Updated Name"
 
+    def test_update_learner_without_return(self, graph):
+        learner = graph.get_or_create_learner()
+        assert graph.update_learner(learner) is None
+
+    def test_update_missing_learner_returns_none(self, graph):
+        learner = graph.get_or_create_learner()
+        learner.id = "missing"
+        assert graph.update_learner(learner, return_updated=True) is None
+
     def test_get_learner_state(self, graph):
         learner = graph.get_or_create_learner()
         outcome = graph.create_outcome(learner.id, "Test goal")
@@ -101,11 +109,14 @@ class TestOutcomeOperations:
         learner = graph.get_or_create_learner()
         outcome = graph.create_outcome(learner.id, "Test goal")
 
-        graph.mark_achieved(outcome.id)
+        retrieved = graph.mark_achieved(outcome.id)
 
-        retrieved = graph.get_outcome(outcome.id)
         assert retrieved.status == OutcomeStatus.ACHIEVED
         assert retrieved.achieved_at is not None
+        assert graph.get_outcome(outcome.id).status == OutcomeStatus.ACHIEVED
+
+    def test_mark_achieved_missing_outcome(self, graph):
+        assert graph.mark_achieved("missing") is None
 
 
 class TestConceptOperations:
@@ -144,13 +155,19 @@ class TestConceptOperations:
 class TestProofOperations:
     """Tests for proof operations."""
 
-    def test_create_proof(self, graph):
+    @pytest.fixture
+    def proof_ctx(self, graph):
+        """Create a learner, concept and session ready for a proof."""
         learner = graph.get_or_create_learner()
         outcome = graph.create_outcome(learner.id, "Test goal")
         concept = graph.create_concept(
             learner.id, "test", "Test", outcome.id
         )
         session = graph.start_session(learner.id, outcome.id)
+        return learner, concept, session
+
+    def test_create_proof(self, graph, proof_ctx):
+        learner, concept, session = proof_ctx
 
         proof = graph.create_proof(
             learner.id,
@@ -169,13 +186,8 @@ class TestProofOperations:
         assert proof is not None
         assert proof.confidence == 0.85
 
-    def test_create_proof_marks_concept_understood(self, graph):
-        learner = graph.get_or_create_learner()
-        outcome = graph.create_outcome(learner.id, "Test goal")
-        concept = graph.create_concept(
-            learner.id, "test", "Test", outcome.id
-        )
-        session = graph.start_session(learner.id, outcome.id)
+    def test_create_proof_marks_concept_understood(self, graph, proof_ctx):
+        learner, concept, session = proof_ctx
 
         graph.create_proof(
             learner.id,
@@ -189,13 +201,8 @@ class TestProofOperations:
         retrieved = graph.get_concept(concept.id)
         assert retrieved.understood_at is not None
 
-    def test_create_proof_increments_learner_total(self, graph):
-        learner = graph.get_or_create_learner()
-        outcome = graph.create_outcome(learner.id, "Test goal")
-        concept = graph.create_concept(
-            learner.id, "test", "Test", outcome.id
-        )
-        session = graph.start_session(learner.id, outcome.id)
+    def test_create_proof_increments_learner_total(self, graph, proof_ctx):
+        learner, concept, session = proof_ctx
 
         assert learner.total_proofs == 0
 
@@ -211,13 +218,8 @@ class TestProofOperations:
         retrieved = graph.get_learner(learner.id)
         assert retrieved.total_proofs == 1
 
-    def test_has_proof(self, graph):
-        learner = graph.get_or_create_learner()
-        outcome = graph.create_outcome(learner.id, "Test goal")
-        concept = graph.create_concept(
-            learner.id, "test", "Test", outcome.id
-        )
-        session = graph.start_session(learner.id, outcome.id)
+    def test_has_proof(self, graph, proof_ctx):
+        learner, concept, session = proof_ctx
 
         assert graph.has_proof(concept.id) is False
 
@@ -260,6 +262,7 @@ class TestSessionOperations:
 
         retrieved = graph.get_learner(learner.id)
         assert retrieved.total_sessions == 1
+        assert retrieved.last_session_at is not None
 
     def test_end_session(self, graph):
         learner = graph.get_or_create_learner()
@@ -48,8 +48,7 @@ class TestGenId:
         assert isinstance(id_val, str)
 
     def test_gen_id_unique(self):
-        ids = [gen_id() for _ in range(100)]
-        assert len(set(ids)) == 100  # All unique
+        assert len({gen_id() for _ in range(100)}) == 100  # All unique
 
 
 class TestEnums:
@@ -67,28 +66,27 @@ class TestEnums:
         assert ConceptStatus.UNDERSTOOD == "understood"
 
     def test_dialogue_mode_values(self):
-        modes = [
-            DialogueMode.CHECK_IN,
-            DialogueMode.FOLLOWUP,
-            DialogueMode.OUTCOME_DISCOVERY,
-            DialogueMode.FRAMING,
-            DialogueMode.PROBING,
-            DialogueMode.TEACHING,
-            DialogueMode.VERIFICATION,
-            DialogueMode.OUTCOME_CHECK,
-        ]
-        assert len(modes) == 8
+        assert {m.value for m in DialogueMode} == {
+            "check_in",
+            "followup",
+            "outcome_discovery",
+            "framing",
+            "probing",
+            "teaching",
+            "verification",
+            "outcome_check",
+            "practice",
+        }
 
     def test_edge_type_values(self):
-        edges = [
-            EdgeType.REQUIRES,
-            EdgeType.RELATES_TO,
-            EdgeType.DEMONSTRATED_BY,
-            EdgeType.EXPLORED_IN,
-            EdgeType.BUILDS_ON,
-            EdgeType.APPLIED_IN,
-        ]
-        assert len(edges) == 6
+        assert {e.value for e in EdgeType} == {
+            "requires",
+            "relates_to",
+            "demonstrated_by",
+            "explored_in",
+            "builds_on",
+            "applied_in",
+        }
 
     def test_age_group_values(self):
         assert AgeGroup.CHILD == "child"
@@ -105,7 +103,8 @@ class TestLearner:
     """Tests for Learner model."""
 
     def test_learner_defaults(self):
-        learner = Learner()
+        # Only default population is under test, so skip validation
+        learner = Learner.model_construct()
         assert learner.id is not None
         assert learner.profile is not None
         assert learner.preferences is not None
@@ -233,7 +232,7 @@ class TestSession:
     """Tests for Session model."""
 
     def test_session_creation(self):
-        session = Session(learner_id="learner-1", outcome_id="outcome-1")
+        session = Session.model_construct(learner_id="learner-1", outcome_id="outcome-1")
         assert session.messages == []
         assert session.concepts_explored == []
         assert session.proofs_earned == []
@@ -359,10 +358,8 @@ class TestJsonSerialization:
                 effective_approaches=["analogies", "real-world examples"],
             ),
         )
-        json_str = original.model_dump_json()
-        restored = Learner.model_validate_json(json_str)
-        assert restored.profile.name == original.profile.name
-        assert restored.insights.effective_approaches == ["analogies", "real-world examples"]
+        restored = Learner.model_validate_json(original.model_dump_json())
+        assert restored == original
 
     def test_session_round_trip(self):
         original = Session(
@@ -374,7 +371,5 @@ class TestJsonSerialization:
             ],
             ending_state=SessionEndingState(mode="probing"),
         )
-        json_str = original.model_dump_json()
-        restored = Session.model_validate_json(json_str)
-        assert len(restored.messages) == 2
-        assert restored.context.energy == EnergyLevel.MEDIUM
+        restored = Session.model_validate_json(original.model_dump_json())
+        assert restored == original
@@ -11,9 +11,9 @@ from sage.orchestration.normalizer import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def normalizer() -> InputNormalizer:
-    """Create normalizer instance for tests."""
+    """Create normalizer instance for tests (stateless, so shared)."""
     return InputNormalizer()
 
 
@@ -82,6 +82,9 @@ class TestInferIntentFromFormId:
             # Application variations
             ("application-event-123", "application_event"),
             ("event_form", "application_event"),
+            # Earlier intents win when several keywords match
+            ("quiz-practice-1", "practice_setup"),
+            ("goal-event", "outcome_discovery"),
             # Generic fallback
             ("unknown-form", "generic_form"),
             ("random123", "generic_form"),
@@ -139,6 +142,17 @@ class TestInputNormalizerForm:
         assert len(result.validation_errors) == 1
         assert "energyLevel" in result.validation_errors[0]
 
+    def test_check_in_errors_follow_schema_order(self, normalizer):
+        """Test validation errors are ordered by schema, not submission."""
+        result = normalizer.normalize_form(
+            "check-in",
+            {"energyLevel": 150, "timeAvailable": "invalid_option"},
+        )
+        assert result.validation_errors == [
+            "Invalid value for timeAvailable: invalid_option",
+            "Invalid value for energyLevel: 150",
+        ]
+
     def test_practice_missing_required(self, normalizer):
         """Test missing required field in practice setup."""
         result = normalizer.normalize_form(
@@ -149,6 +163,14 @@ class TestInputNormalizerForm:
         assert result.data_complete is False
         assert "scenario_type" in result.missing_fields
 
+    def test_practice_empty(self, normalizer):
+        """Test empty practice setup form reports every required field."""
+        result = normalizer.normalize_form("practice-setup", {})
+        assert result.intent == "practice_setup"
+        assert result.data_complete is False
+        assert result.missing_fields == ["scenario_type"]
+        assert result.validation_errors == []
+
     def test_practice_complete(self, normalizer):
         """Test complete practice setup form."""
         result = normalizer.normalize_form(
@@ -387,3 +409,14 @@ class TestFormSchemas:
         for intent, schema in FORM_SCHEMAS.items():
             for field, validator in schema.get("validators", {}).items():
                 assert callable(validator), f"{intent}.{field} validator not callable"
+
+    def test_schemas_read_only(self):
+        """Test schemas cannot be edited after the compiled tables are built."""
+        with pytest.raises(TypeError):
+            FORM_SCHEMAS["new_intent"] = {}
+        with pytest.raises(TypeError):
+            FORM_SCHEMAS["verification"]["required"] = []
+        with pytest.raises(AttributeError):
+            FORM_SCHEMAS["verification"]["required"].append("extra")
+        with pytest.raises(TypeError):
+            FORM_SCHEMAS["verification"]["validators"]["notes"] = callable
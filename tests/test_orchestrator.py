@@ -1,6 +1,6 @@
 """Tests for the SAGE Orchestrator."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -12,7 +12,9 @@ from sage.orchestration.orchestrator import (
     OutputStrategy,
     SAGEOrchestrator,
     _OUTPUT_STRATEGY_MAP,
+    _build_probe_prompt,
 )
+from tests.conftest import make_llm_response
 
 
 def make_request_more_decision(
@@ -45,13 +47,22 @@ def make_normalized_input(
     )
 
 
-def make_mock_extraction_response(content: str) -> MagicMock:
-    """Create a mock LLM extraction response."""
-    mock_response = MagicMock()
-    mock_response.choices = [
-        MagicMock(message=MagicMock(content=content))
-    ]
-    return mock_response
+def async_return(value):
+    """Create an async stand-in that always returns value."""
+
+    async def _return(*args, **kwargs):
+        return value
+
+    return _return
+
+
+def async_raise(exc: Exception):
+    """Create an async stand-in that always raises exc."""
+
+    async def _raise(*args, **kwargs):
+        raise exc
+
+    return _raise
 
 
 @pytest.fixture
@@ -75,12 +86,18 @@ def orchestrator(mock_graph, mock_llm_client):
 class TestOutputStrategy:
     """Test OutputStrategy enum."""
 
-    def test_enum_values(self):
+    @pytest.mark.parametrize(
+        "strategy,value",
+        [
+            (OutputStrategy.TEXT_ONLY, "text_only"),
+            (OutputStrategy.UI_TREE, "ui_tree"),
+            (OutputStrategy.VOICE_DESCRIPTION, "voice_description"),
+            (OutputStrategy.HYBRID, "hybrid"),
+        ],
+    )
+    def test_enum_values(self, strategy, value):
         """Test all strategy values exist."""
-        assert OutputStrategy.TEXT_ONLY.value == "text_only"
-        assert OutputStrategy.UI_TREE.value == "ui_tree"
-        assert OutputStrategy.VOICE_DESCRIPTION.value == "voice_description"
-        assert OutputStrategy.HYBRID.value == "hybrid"
+        assert strategy.value == value
 
 
 class TestOrchestratorDecision:
@@ -119,25 +136,19 @@ class TestOrchestratorDecision:
 class TestOutputStrategyMapping:
     """Test output strategy determination."""
 
-    def test_session_check_in_form_uses_ui_tree(self):
-        """Test form check-in uses UI tree."""
-        key = ("session_check_in", InputModality.FORM)
-        assert _OUTPUT_STRATEGY_MAP[key] == OutputStrategy.UI_TREE
-
-    def test_session_check_in_voice_uses_voice_description(self):
-        """Test voice check-in uses voice description."""
-        key = ("session_check_in", InputModality.VOICE)
-        assert _OUTPUT_STRATEGY_MAP[key] == OutputStrategy.VOICE_DESCRIPTION
-
-    def test_practice_setup_voice_uses_hybrid(self):
-        """Test voice practice setup uses hybrid."""
-        key = ("practice_setup", InputModality.VOICE)
-        assert _OUTPUT_STRATEGY_MAP[key] == OutputStrategy.HYBRID
-
-    def test_verification_uses_text_only(self):
-        """Test verification always uses text."""
-        assert _OUTPUT_STRATEGY_MAP[("verification", InputModality.FORM)] == OutputStrategy.TEXT_ONLY
-        assert _OUTPUT_STRATEGY_MAP[("verification", InputModality.VOICE)] == OutputStrategy.TEXT_ONLY
+    @pytest.mark.parametrize(
+        "intent,modality,expected",
+        [
+            ("session_check_in", InputModality.FORM, OutputStrategy.UI_TREE),
+            ("session_check_in", InputModality.VOICE, OutputStrategy.VOICE_DESCRIPTION),
+            ("practice_setup", InputModality.VOICE, OutputStrategy.HYBRID),
+            ("verification", InputModality.FORM, OutputStrategy.TEXT_ONLY),
+            ("verification", InputModality.VOICE, OutputStrategy.TEXT_ONLY),
+        ],
+    )
+    def test_output_strategy_map(self, intent, modality, expected):
+        """Test each intent/modality pair maps to its output strategy."""
+        assert _OUTPUT_STRATEGY_MAP[(intent, modality)] == expected
 
 
 class TestSAGEOrchestratorInit:
@@ -344,10 +355,7 @@ class TestCreateDataRequestResponse:
 
     async def test_voice_uses_llm_probe(self, orchestrator, mock_llm_client):
         """Test voice modality generates conversational probe via LLM."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="Got it, 30 minutes. How are you feeling energy-wise?"))
-        ]
+        mock_response = make_llm_response("Got it, 30 minutes. How are you feeling energy-wise?")
         mock_llm_client.chat.completions.create.return_value = mock_response
 
         decision = make_request_more_decision("session_check_in", ["energyLevel"])
@@ -365,10 +373,7 @@ class TestCreateDataRequestResponse:
 
     async def test_chat_uses_llm_probe(self, orchestrator, mock_llm_client):
         """Test chat modality generates conversational probe via LLM."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="What kind of scenario would you like to practice?"))
-        ]
+        mock_response = make_llm_response("What kind of scenario would you like to practice?")
         mock_llm_client.chat.completions.create.return_value = mock_response
 
         decision = make_request_more_decision("practice_setup", ["scenario_type"])
@@ -435,9 +440,7 @@ class TestProcessInput:
             current_mode=DialogueMode.CHECK_IN,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         response = await orchestrator.process_input(
             raw_input="",
@@ -465,12 +468,12 @@ class TestProcessInput:
 
     async def test_voice_input_triggers_extraction(self, orchestrator, mock_llm_client):
         """Test voice input triggers intent extraction."""
-        mock_llm_client.chat.completions.create.return_value = make_mock_extraction_response(
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
             '{"intent": "session_check_in", "data": {"timeAvailable": "focused"}, "confidence": 0.9}'
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=SAGEResponse(
+        orchestrator.conversation_engine.process_turn_streaming = async_return(
+            SAGEResponse(
                 message="Got it, 30 minutes.",
                 current_mode=DialogueMode.CHECK_IN,
             )
@@ -490,12 +493,12 @@ class TestProcessInput:
             intent="session_check_in",
             collected_data={"timeAvailable": "focused"},
         )
-        mock_llm_client.chat.completions.create.return_value = make_mock_extraction_response(
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
             '{"intent": "session_check_in", "data": {"energyLevel": 80}, "confidence": 0.9}'
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=SAGEResponse(
+        orchestrator.conversation_engine.process_turn_streaming = async_return(
+            SAGEResponse(
                 message="Great!",
                 current_mode=DialogueMode.CHECK_IN,
             )
@@ -515,8 +518,6 @@ class TestBuildProbePrompt:
 
     def test_includes_intent_context(self):
         """Test prompt includes intent-appropriate context."""
-        from sage.orchestration.orchestrator import _build_probe_prompt
-
         prompt = _build_probe_prompt(
             intent="session_check_in",
             collected_data={"timeAvailable": "focused"},
@@ -529,8 +530,6 @@ class TestBuildProbePrompt:
 
     def test_handles_empty_collected_data(self):
         """Test prompt handles no collected data."""
-        from sage.orchestration.orchestrator import _build_probe_prompt
-
         prompt = _build_probe_prompt(
             intent="practice_setup",
             collected_data={},
@@ -542,8 +541,6 @@ class TestBuildProbePrompt:
 
     def test_multiple_missing_fields(self):
         """Test prompt lists all missing fields."""
-        from sage.orchestration.orchestrator import _build_probe_prompt
-
         prompt = _build_probe_prompt(
             intent="session_check_in",
             collected_data={},
@@ -571,18 +568,12 @@ class TestMultiTurnVoiceFlow:
         def mock_create(**kwargs):
             messages = kwargs.get("messages", [])
             if any("Generate a brief follow-up" in str(m) for m in messages):
-                mock_resp = MagicMock()
-                mock_resp.choices = [
-                    MagicMock(message=MagicMock(content="Got it, hard mode. What kind of scenario—pricing, negotiation, or something else?"))
-                ]
+                mock_resp = make_llm_response("Got it, hard mode. What kind of scenario—pricing, negotiation, or something else?")
                 return mock_resp
             # Intent extraction returns incomplete data (difficulty but no scenario_type)
-            mock_resp = MagicMock()
-            mock_resp.choices = [
-                MagicMock(message=MagicMock(
-                    content='{"intent": "practice_setup", "data": {"difficulty": "hard"}, "confidence": 0.9}'
-                ))
-            ]
+            mock_resp = make_llm_response(
+                '{"intent": "practice_setup", "data": {"difficulty": "hard"}, "confidence": 0.9}'
+            )
             return mock_resp
 
         mock_llm_client.chat.completions.create.side_effect = mock_create
@@ -614,12 +605,12 @@ class TestMultiTurnVoiceFlow:
         )
 
         # Mock extraction to return complete data (merges with pending)
-        mock_llm_client.chat.completions.create.return_value = make_mock_extraction_response(
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
             '{"intent": "session_check_in", "data": {"energyLevel": 80}, "confidence": 0.9}'
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=SAGEResponse(
+        orchestrator.conversation_engine.process_turn_streaming = async_return(
+            SAGEResponse(
                 message="Great, let's get started!",
                 current_mode=DialogueMode.CHECK_IN,
             )
@@ -652,9 +643,7 @@ class TestUIGenerationIntegration:
             current_mode=DialogueMode.CHECK_IN,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         # Mock UI agent response
         ui_response = json.dumps({
@@ -663,9 +652,7 @@ class TestUIGenerationIntegration:
             "purpose": "Session check-in",
             "estimated_interaction_time": 30,
         })
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(content=ui_response))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(ui_response)
 
         response = await orchestrator.process_input(
             raw_input="",
@@ -685,10 +672,8 @@ class TestUIGenerationIntegration:
         """Test no UI tree generated for voice-only modality with VOICE_DESCRIPTION."""
         import json
         # Mock extraction
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content='{"intent": "session_check_in", "data": {"timeAvailable": "focused", "energyLevel": 80}, "confidence": 0.9}'
-            ))]
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
+            '{"intent": "session_check_in", "data": {"timeAvailable": "focused", "energyLevel": 80}, "confidence": 0.9}'
         )
 
         # Mock conversation engine
@@ -697,9 +682,7 @@ class TestUIGenerationIntegration:
             current_mode=DialogueMode.CHECK_IN,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         response = await orchestrator.process_input(
             raw_input="I have 45 minutes and feeling good",
@@ -718,12 +701,10 @@ class TestUIGenerationIntegration:
             current_mode=DialogueMode.CHECK_IN,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         # Mock UI agent to fail
-        orchestrator.ui_agent.generate_async = AsyncMock(side_effect=Exception("LLM timeout"))
+        orchestrator.ui_agent.generate_async = async_raise(Exception("LLM timeout"))
 
         response = await orchestrator.process_input(
             raw_input="",
@@ -757,13 +738,9 @@ class TestUIGenerationIntegration:
             # Check if this is a UI generation call (has UI_AGENT_SYSTEM_PROMPT)
             system_msg = messages[0].get("content", "") if messages else ""
             if "UI generation agent" in system_msg or "You generate UI component trees" in system_msg:
-                return MagicMock(
-                    choices=[MagicMock(message=MagicMock(content=ui_response))]
-                )
+                return make_llm_response(ui_response)
             # Otherwise it's extraction
-            return MagicMock(
-                choices=[MagicMock(message=MagicMock(content=extraction_response))]
-            )
+            return make_llm_response(extraction_response)
 
         mock_llm_client.chat.completions.create.side_effect = mock_create
 
@@ -773,9 +750,7 @@ class TestUIGenerationIntegration:
             current_mode=DialogueMode.PROBING,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         response = await orchestrator.process_input(
             raw_input="Start a negotiation practice",
@@ -840,11 +815,7 @@ class TestVoiceToFormFieldMapping:
     async def test_voice_input_includes_form_field_updates(self, orchestrator, mock_llm_client):
         """Test voice input returns form_field_updates with extracted values."""
         # Mock LLM probe generation
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="Great, about 30 minutes. How's your energy level?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("Great, about 30 minutes. How's your energy level?")
 
         decision = make_request_more_decision("session_check_in", ["energyLevel"])
         normalized = NormalizedInput(
@@ -878,11 +849,7 @@ class TestVoiceToFormFieldMapping:
 
     async def test_chat_modality_no_form_field_updates(self, orchestrator, mock_llm_client):
         """Test chat modality does not include form_field_updates."""
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="How much time do you have?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("How much time do you have?")
 
         decision = make_request_more_decision("session_check_in", ["timeAvailable"])
         normalized = NormalizedInput(
@@ -899,11 +866,7 @@ class TestVoiceToFormFieldMapping:
 
     async def test_hybrid_modality_includes_form_field_updates(self, orchestrator, mock_llm_client):
         """Test hybrid modality includes form_field_updates."""
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="Got it. What difficulty level?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("Got it. What difficulty level?")
 
         decision = make_request_more_decision("practice_setup", ["scenario_type"])
         normalized = NormalizedInput(
@@ -922,11 +885,7 @@ class TestVoiceToFormFieldMapping:
 
     async def test_voice_empty_data_no_form_field_updates(self, orchestrator, mock_llm_client):
         """Test voice with no extracted data does not include form_field_updates."""
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="What would you like to practice?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("What would you like to practice?")
 
         decision = make_request_more_decision("practice_setup", ["scenario_type"])
         normalized = NormalizedInput(
@@ -945,7 +904,7 @@ class TestVoiceToFormFieldMapping:
     async def test_form_field_updates_in_complete_response(self, orchestrator, mock_llm_client):
         """Test form_field_updates in _process_with_engine for complete voice data."""
         # Mock extraction returns complete data
-        mock_llm_client.chat.completions.create.return_value = make_mock_extraction_response(
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
             '{"intent": "session_check_in", "data": {"timeAvailable": "focused", "energyLevel": 75}, "confidence": 0.95}'
         )
 
@@ -955,9 +914,7 @@ class TestVoiceToFormFieldMapping:
             current_mode=DialogueMode.CHECK_IN,
         )
         orchestrator.conversation_engine.resume_session = MagicMock()
-        orchestrator.conversation_engine.process_turn_streaming = AsyncMock(
-            return_value=mock_response
-        )
+        orchestrator.conversation_engine.process_turn_streaming = async_return(mock_response)
 
         response = await orchestrator.process_input(
             raw_input="I have about 30 minutes and feeling pretty good",
@@ -972,11 +929,7 @@ class TestVoiceToFormFieldMapping:
 
     async def test_form_field_updates_multiple_fields(self, orchestrator, mock_llm_client):
         """Test form_field_updates includes all extracted fields."""
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="Got it. What's your mindset like?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("Got it. What's your mindset like?")
 
         decision = make_request_more_decision("session_check_in", ["mindset"])
         normalized = NormalizedInput(
@@ -1002,11 +955,7 @@ class TestVoiceToFormFieldMapping:
         """Test form_field_updates field names match FORM_SCHEMAS."""
         from sage.orchestration.normalizer import FORM_SCHEMAS
 
-        mock_llm_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(
-                content="What type of scenario?"
-            ))]
-        )
+        mock_llm_client.chat.completions.create.return_value = make_llm_response("What type of scenario?")
 
         decision = make_request_more_decision("practice_setup", ["scenario_type"])
         normalized = NormalizedInput(
@@ -3,9 +3,12 @@
 Note: Common fixtures (test_graph, client, test_learner, auth_headers) come from conftest.py.
 """
 
+import json
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import MagicMock, patch
 
+from sage.api.routes import practice as practice_routes
 from sage.graph.models import (
     Message,
     PracticeFeedback,
@@ -13,7 +16,7 @@ from sage.graph.models import (
     Session,
     SessionType,
 )
-from tests.conftest import create_test_token
+from tests.conftest import create_test_token, make_llm_response
 
 
 # =============================================================================
@@ -21,54 +24,56 @@ from tests.conftest import create_test_token
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_openai_response():
     """Create a mock OpenAI response."""
-    mock_choice = MagicMock()
-    mock_choice.message.content = "Hello, I'm here to discuss your proposal."
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
-    return mock_response
+    return make_llm_response("Hello, I'm here to discuss your proposal.")
 
 
-@pytest.fixture
-def mock_feedback_response():
-    """Create a mock feedback response from OpenAI."""
-    mock_choice = MagicMock()
-    mock_choice.message.content = '''```json
-{
+_FEEDBACK_PAYLOAD = {
     "positives": ["Clear communication", "Good questions"],
     "improvements": ["Be more assertive", "Ask about budget earlier"],
     "summary": "Good practice session with room for improvement.",
-    "revealed_gaps": ["negotiation tactics"]
+    "revealed_gaps": ["negotiation tactics"],
 }
-```'''
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
-    return mock_response
+_FEEDBACK_JSON = f"```json\n{json.dumps(_FEEDBACK_PAYLOAD, indent=4)}\n```"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_feedback_response():
+    """Create a mock feedback response from OpenAI."""
+    return make_llm_response(_FEEDBACK_JSON)
+
+
+@pytest.fixture(scope="module")
 def mock_hint_response():
     """Create a mock hint response."""
-    mock_choice = MagicMock()
-    mock_choice.message.content = "Try addressing their concern directly."
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
-    return mock_response
+    return make_llm_response("Try addressing their concern directly.")
+
+
+@pytest.fixture
+def mock_llm_client(monkeypatch):
+    """Patch the practice routes' LLM client with a MagicMock."""
+    mock_client = MagicMock()
+    monkeypatch.setattr(practice_routes, "_get_llm_client", lambda: mock_client)
+    return mock_client
+
+
+# Validated once at import; tests get a deep copy so mutations don't leak.
+_PRACTICE_SCENARIO = PracticeScenario(
+    scenario_id="test-scenario-1",
+    title="Pricing Negotiation",
+    description="Practice negotiating your freelance rates",
+    sage_role="Skeptical Client",
+    user_role="Freelancer",
+    related_concepts=["pricing", "negotiation"],
+)
 
 
 @pytest.fixture
 def practice_scenario():
     """Create a test practice scenario."""
-    return PracticeScenario(
-        scenario_id="test-scenario-1",
-        title="Pricing Negotiation",
-        description="Practice negotiating your freelance rates",
-        sage_role="Skeptical Client",
-        user_role="Freelancer",
-        related_concepts=["pricing", "negotiation"],
-    )
+    return _PRACTICE_SCENARIO.model_copy(deep=True)
 
 
 @pytest.fixture
@@ -234,14 +239,11 @@ class TestSessionWithPractice:
 class TestPracticeStartEndpoint:
     """Test POST /api/practice/start endpoint."""
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_start_practice_success(
-        self, mock_get_client, client, test_graph, test_learner, auth_headers, mock_openai_response
+        self, client, mock_llm_client, test_graph, test_learner, auth_headers, mock_openai_response
     ):
         """Test starting a practice session."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_openai_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_openai_response
 
         response = client.post(
             "/api/practice/start",
@@ -261,14 +263,11 @@ class TestPracticeStartEndpoint:
         assert "initial_message" in data
         assert data["initial_message"] == "Hello, I'm here to discuss your proposal."
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_start_practice_with_learner_id(
-        self, mock_get_client, client, test_graph, test_learner, auth_headers, mock_openai_response
+        self, client, mock_llm_client, test_graph, test_learner, auth_headers, mock_openai_response
     ):
         """Test starting practice with existing learner."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_openai_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_openai_response
 
         response = client.post(
             "/api/practice/start",
@@ -292,14 +291,11 @@ class TestPracticeStartEndpoint:
 class TestPracticeMessageEndpoint:
     """Test POST /api/practice/{session_id}/message endpoint."""
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_send_message_success(
-        self, mock_get_client, client, test_graph, auth_headers, practice_session, mock_openai_response
+        self, client, mock_llm_client, test_graph, auth_headers, practice_session, mock_openai_response
     ):
         """Test sending a message in practice mode."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_openai_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_openai_response
 
         response = client.post(
             f"/api/practice/{practice_session.id}/message",
@@ -342,14 +338,11 @@ class TestPracticeMessageEndpoint:
 class TestPracticeHintEndpoint:
     """Test POST /api/practice/{session_id}/hint endpoint."""
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_get_hint_success(
-        self, mock_get_client, client, test_graph, auth_headers, practice_session, mock_hint_response
+        self, client, mock_llm_client, test_graph, auth_headers, practice_session, mock_hint_response
     ):
         """Test getting a hint during practice."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_hint_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_hint_response
 
         response = client.post(f"/api/practice/{practice_session.id}/hint", headers=auth_headers)
 
@@ -368,34 +361,24 @@ class TestPracticeHintEndpoint:
 class TestPracticeEndEndpoint:
     """Test POST /api/practice/{session_id}/end endpoint."""
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_end_practice_success(
-        self, mock_get_client, client, test_graph, auth_headers, practice_session, mock_feedback_response
+        self, client, mock_llm_client, test_graph, auth_headers, practice_session, mock_feedback_response
     ):
         """Test ending a practice session."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_feedback_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_feedback_response
 
         response = client.post(f"/api/practice/{practice_session.id}/end", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
-        assert "positives" in data
-        assert "improvements" in data
-        assert "summary" in data
-        assert "revealed_gaps" in data
-        assert len(data["positives"]) == 2
-        assert "Clear communication" in data["positives"]
-
-    @patch("sage.api.routes.practice._get_llm_client")
+        for key, expected in _FEEDBACK_PAYLOAD.items():
+            assert data[key] == expected
+
     def test_end_practice_stores_feedback(
-        self, mock_get_client, client, test_graph, auth_headers, practice_session, mock_feedback_response
+        self, client, mock_llm_client, test_graph, auth_headers, practice_session, mock_feedback_response
     ):
         """Test that ending practice stores feedback in session."""
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_feedback_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = mock_feedback_response
 
         client.post(f"/api/practice/{practice_session.id}/end", headers=auth_headers)
 
@@ -404,20 +387,14 @@ class TestPracticeEndEndpoint:
         assert updated_session.practice_feedback is not None
         assert updated_session.ended_at is not None
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_end_practice_fallback_on_parse_error(
-        self, mock_get_client, client, test_graph, auth_headers, practice_session
+        self, client, mock_llm_client, test_graph, auth_headers, practice_session
     ):
         """Test fallback when LLM returns invalid JSON."""
-        mock_client = MagicMock()
-
         # Return invalid JSON
-        mock_choice = MagicMock()
-        mock_choice.message.content = "This is not valid JSON at all"
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_get_client.return_value = mock_client
+        mock_llm_client.chat.completions.create.return_value = make_llm_response(
+            "This is not valid JSON at all"
+        )
 
         response = client.post(f"/api/practice/{practice_session.id}/end", headers=auth_headers)
 
@@ -441,16 +418,20 @@ class TestPracticeEndEndpoint:
 class TestPracticeFlow:
     """Integration tests for complete practice flow."""
 
-    @patch("sage.api.routes.practice._get_llm_client")
     def test_complete_practice_flow(
-        self, mock_get_client, client, test_graph, test_learner, auth_headers, mock_openai_response, mock_feedback_response
+        self, client, mock_llm_client, test_graph, test_learner, auth_headers, mock_openai_response, mock_feedback_response
     ):
         """Test a complete practice session from start to end."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        # One LLM call per request: start, two messages, hint, end
+        mock_llm_client.chat.completions.create.side_effect = [
+            mock_openai_response,
+            mock_openai_response,
+            mock_openai_response,
+            make_llm_response("Here's a tip."),
+            mock_feedback_response,
+        ]
 
         # 1. Start practice
-        mock_client.chat.completions.create.return_value = mock_openai_response
         start_response = client.post(
             "/api/practice/start",
             headers=auth_headers,
@@ -474,17 +455,10 @@ class TestPracticeFlow:
             assert msg_response.status_code == 200
 
         # 3. Get a hint
-        hint_choice = MagicMock()
-        hint_choice.message.content = "Here's a tip."
-        hint_response_mock = MagicMock()
-        hint_response_mock.choices = [hint_choice]
-        mock_client.chat.completions.create.return_value = hint_response_mock
-
         hint_response = client.post(f"/api/practice/{session_id}/hint", headers=auth_headers)
         assert hint_response.status_code == 200
 
         # 4. End practice
-        mock_client.chat.completions.create.return_value = mock_feedback_response
         end_response = client.post(f"/api/practice/{session_id}/end", headers=auth_headers)
         assert end_response.status_code == 200
 
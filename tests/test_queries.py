@@ -39,92 +39,93 @@ def queries(store):
 @pytest.fixture
 def populated_store(store):
     """Create a store with sample data."""
-    # Create learner
-    learner = Learner(profile=LearnerProfile(name="Test Learner"))
-    store.create_learner(learner)
-
-    # Create outcome
-    outcome = Outcome(
-        learner_id=learner.id,
-        stated_goal="Learn pricing",
-        status=OutcomeStatus.ACTIVE,
-    )
-    store.create_outcome(outcome)
-
-    # Set active outcome
-    learner.active_outcome_id = outcome.id
-    store.update_learner(learner)
-
-    # Create concepts
-    concept1 = Concept(
-        learner_id=learner.id,
-        name="value-articulation",
-        display_name="Value Articulation",
-        discovered_from=outcome.id,
-        status=ConceptStatus.UNDERSTOOD,
-    )
-    concept2 = Concept(
-        learner_id=learner.id,
-        name="pricing-psychology",
-        display_name="Pricing Psychology",
-        discovered_from=outcome.id,
-        status=ConceptStatus.TEACHING,
-    )
-    concept3 = Concept(
-        learner_id=learner.id,
-        name="negotiation-tactics",
-        display_name="Negotiation Tactics",
-        discovered_from=outcome.id,
-        status=ConceptStatus.IDENTIFIED,
-    )
-    store.create_concept(concept1)
-    store.create_concept(concept2)
-    store.create_concept(concept3)
-
-    # Create session
-    session = Session(learner_id=learner.id, outcome_id=outcome.id)
-    store.create_session(session)
-
-    # Create proof for concept1
-    proof = Proof(
-        learner_id=learner.id,
-        concept_id=concept1.id,
-        session_id=session.id,
-        demonstration_type=DemoType.APPLICATION,
-        evidence="Successfully explained value proposition",
-        confidence=0.9,
-        exchange=ProofExchange(
-            prompt="Explain why your service is valuable",
-            response="Great explanation...",
-            analysis="Showed clear understanding",
-        ),
-    )
-    store.create_proof(proof)
-
-    # Create relates_to edge between concepts
-    edge = Edge(
-        from_id=concept1.id,
-        from_type="concept",
-        to_id=concept2.id,
-        to_type="concept",
-        edge_type=EdgeType.RELATES_TO,
-        metadata={"relationship": "supports", "strength": 0.8},
-    )
-    store.create_edge(edge)
-
-    # Create application event
-    app_event = ApplicationEvent(
-        learner_id=learner.id,
-        concept_ids=[concept1.id],
-        session_id=session.id,
-        context="pricing call tomorrow",
-        planned_date=date(2024, 1, 15),
-        status=ApplicationStatus.COMPLETED,
-        outcome_result="mixed",
-        what_worked="Stated value clearly",
-        what_struggled="Handled objection poorly",
-    )
-    store.create_application_event(app_event)
+    with store.transaction():
+        # Create learner
+        learner = Learner(profile=LearnerProfile(name="Test Learner"))
+        store.create_learner(learner)
+
+        # Create outcome
+        outcome = Outcome(
+            learner_id=learner.id,
+            stated_goal="Learn pricing",
+            status=OutcomeStatus.ACTIVE,
+        )
+        store.create_outcome(outcome)
+
+        # Set active outcome
+        learner.active_outcome_id = outcome.id
+        store.update_learner(learner)
+
+        # Create concepts
+        concept1 = Concept(
+            learner_id=learner.id,
+            name="value-articulation",
+            display_name="Value Articulation",
+            discovered_from=outcome.id,
+            status=ConceptStatus.UNDERSTOOD,
+        )
+        concept2 = Concept(
+            learner_id=learner.id,
+            name="pricing-psychology",
+            display_name="Pricing Psychology",
+            discovered_from=outcome.id,
+            status=ConceptStatus.TEACHING,
+        )
+        concept3 = Concept(
+            learner_id=learner.id,
+            name="negotiation-tactics",
+            display_name="Negotiation Tactics",
+            discovered_from=outcome.id,
+            status=ConceptStatus.IDENTIFIED,
+        )
+        store.create_concept(concept1)
+        store.create_concept(concept2)
+        store.create_concept(concept3)
+
+        # Create session
+        session = Session(learner_id=learner.id, outcome_id=outcome.id)
+        store.create_session(session)
+
+        # Create proof for concept1
+        proof = Proof(
+            learner_id=learner.id,
+            concept_id=concept1.id,
+            session_id=session.id,
+            demonstration_type=DemoType.APPLICATION,
+            evidence="Successfully explained value proposition",
+            confidence=0.9,
+            exchange=ProofExchange(
+                prompt="Explain why your service is valuable",
+                response="Great explanation...",
+                analysis="Showed clear understanding",
+            ),
+        )
+        store.create_proof(proof)
+
+        # Create relates_to edge between concepts
+        edge = Edge(
+            from_id=concept1.id,
+            from_type="concept",
+            to_id=concept2.id,
+            to_type="concept",
+            edge_type=EdgeType.RELATES_TO,
+            metadata={"relationship": "supports", "strength": 0.8},
+        )
+        store.create_edge(edge)
+
+        # Create application event
+        app_event = ApplicationEvent(
+            learner_id=learner.id,
+            concept_ids=[concept1.id],
+            session_id=session.id,
+            context="pricing call tomorrow",
+            planned_date=date(2024, 1, 15),
+            status=ApplicationStatus.COMPLETED,
+            outcome_result="mixed",
+            what_worked="Stated value clearly",
+            what_struggled="Handled objection poorly",
+        )
+        store.create_application_event(app_event)
 
     return {
         "store": store,
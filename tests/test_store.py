@@ -1,5 +1,6 @@
 """Tests for SAGE GraphStore."""
 
+import threading
 from datetime import date, datetime
 
 import pytest
@@ -63,6 +64,63 @@ class TestGraphStoreInit:
                 assert result is not None, f"Table {table} should exist"
 
 
+class TestTransactions:
+    """Tests for grouping store operations in one transaction."""
+
+    def test_transaction_commits_all_writes(self, tmp_path):
+        store = GraphStore(tmp_path / "tx.db")
+        learner = Learner()
+        with store.transaction():
+            store.create_learner(learner)
+            store.create_outcome(Outcome(learner_id=learner.id, stated_goal="Goal"))
+
+        reopened = GraphStore(tmp_path / "tx.db")
+        assert reopened.get_learner(learner.id) is not None
+        assert len(reopened.get_outcomes_by_learner(learner.id)) == 1
+
+    def test_transaction_rolls_back_on_error(self, tmp_path):
+        store = GraphStore(tmp_path / "tx.db")
+        learner = Learner()
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.create_learner(learner)
+                raise RuntimeError("boom")
+
+        assert store.get_learner(learner.id) is None
+
+    def test_nested_transaction_joins_outer(self, store):
+        learner = Learner()
+        with store.transaction() as outer:
+            with store.transaction() as inner:
+                assert inner is outer
+                store.create_learner(learner)
+
+        assert store.get_learner(learner.id) is not None
+
+    def test_transaction_is_scoped_to_calling_thread(self, tmp_path):
+        store = GraphStore(tmp_path / "tx.db")
+        inside, outside = Learner(), Learner()
+        errors = []
+
+        def write_outside():
+            try:
+                store.create_learner(outside)
+            except Exception as e:  # surfaced via the assert below
+                errors.append(e)
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                worker = threading.Thread(target=write_outside)
+                worker.start()
+                worker.join()
+                store.create_learner(inside)
+                raise RuntimeError("boom")
+
+        assert errors == []
+        assert store.get_learner(outside.id) is not None
+        assert store.get_learner(inside.id) is None
+
+
 class TestLearnerOperations:
     """Tests for learner CRUD operations."""
 
@@ -12,6 +12,51 @@ from sage.orchestration.ui_agent import (
     UI_AGENT_SYSTEM_PROMPT,
     create_ui_agent,
 )
+from tests.conftest import make_llm_response
+
+
+# =============================================================================
+# Canned LLM Payloads (serialized once at import)
+# =============================================================================
+
+_CHECK_IN_SPEC_JSON = json.dumps({
+    "tree": {
+        "component": "Card",
+        "props": {"title": "Check-in"},
+        "children": [
+            {"component": "Text", "props": {"content": "How are you?"}}
+        ],
+    },
+    "voice_fallback": "How are you showing up today?",
+    "purpose": "Session check-in",
+    "estimated_interaction_time": 45,
+})
+
+_GREETING_SPEC_JSON = json.dumps({
+    "tree": {"component": "Text", "props": {"content": "Hello"}},
+    "voice_fallback": "Hello",
+    "purpose": "Greeting",
+})
+
+_CARD_SPEC_JSON = json.dumps({
+    "tree": {"component": "Card", "props": {}},
+    "voice_fallback": "A card",
+    "purpose": "Display card",
+})
+
+_STACK_SPEC_JSON = json.dumps({
+    "tree": {"component": "Stack", "props": {}},
+    "voice_fallback": "Form content",
+    "purpose": "Data collection",
+})
+
+_TEST_CARD_SPEC_JSON = json.dumps({
+    "tree": {"component": "Card", "props": {}},
+    "voice_fallback": "Test",
+    "purpose": "Test",
+})
+
+_INVALID_SPEC_JSON = json.dumps({"invalid": "structure"})
 
 
 @pytest.fixture
@@ -152,20 +197,7 @@ class TestUIGenerationAgent:
 
     def test_parse_response_valid(self, agent):
         """Test parsing valid JSON response."""
-        response_json = json.dumps({
-            "tree": {
-                "component": "Card",
-                "props": {"title": "Check-in"},
-                "children": [
-                    {"component": "Text", "props": {"content": "How are you?"}}
-                ],
-            },
-            "voice_fallback": "How are you showing up today?",
-            "purpose": "Session check-in",
-            "estimated_interaction_time": 45,
-        })
-
-        spec = agent._parse_response(response_json)
+        spec = agent._parse_response(_CHECK_IN_SPEC_JSON)
 
         assert spec.tree.component == "Card"
         assert spec.tree.props["title"] == "Check-in"
@@ -176,13 +208,7 @@ class TestUIGenerationAgent:
 
     def test_parse_response_minimal(self, agent):
         """Test parsing response with minimal fields."""
-        response_json = json.dumps({
-            "tree": {"component": "Text", "props": {"content": "Hello"}},
-            "voice_fallback": "Hello",
-            "purpose": "Greeting",
-        })
-
-        spec = agent._parse_response(response_json)
+        spec = agent._parse_response(_GREETING_SPEC_JSON)
 
         assert spec.tree.component == "Text"
         assert spec.estimated_interaction_time == 30  # Default
@@ -195,22 +221,11 @@ class TestUIGenerationAgent:
     def test_parse_response_invalid_structure(self, agent):
         """Test parsing invalid structure raises error."""
         with pytest.raises(ValueError, match="Failed to validate"):
-            agent._parse_response(json.dumps({"invalid": "structure"}))
+            agent._parse_response(_INVALID_SPEC_JSON)
 
     def test_generate_sync(self, agent, mock_client):
         """Test synchronous generation."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content=json.dumps({
-                        "tree": {"component": "Card", "props": {}},
-                        "voice_fallback": "A card",
-                        "purpose": "Display card",
-                    })
-                )
-            )
-        ]
+        mock_response = make_llm_response(_CARD_SPEC_JSON)
         mock_client.chat.completions.create.return_value = mock_response
 
         spec = agent.generate("Test purpose")
@@ -229,18 +244,7 @@ class TestUIGenerationAgent:
 
     def test_generate_with_context(self, agent, mock_client):
         """Test generation with context dict."""
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content=json.dumps({
-                        "tree": {"component": "Stack", "props": {}},
-                        "voice_fallback": "Form content",
-                        "purpose": "Data collection",
-                    })
-                )
-            )
-        ]
+        mock_response = make_llm_response(_STACK_SPEC_JSON)
         mock_client.chat.completions.create.return_value = mock_response
 
         spec = agent.generate(
@@ -359,18 +363,7 @@ class TestUIGenerationAgentAsync:
         from openai import AsyncOpenAI
 
         mock_client = MagicMock(spec=AsyncOpenAI)
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content=json.dumps({
-                        "tree": {"component": "Card", "props": {}},
-                        "voice_fallback": "Test",
-                        "purpose": "Test",
-                    })
-                )
-            )
-        ]
+        mock_response = make_llm_response(_TEST_CARD_SPEC_JSON)
 
         # Create async mock that returns the response
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
@@ -384,18 +377,7 @@ class TestUIGenerationAgentAsync:
     async def test_generate_async_with_sync_client_fallback(self):
         """Test async generation falls back for sync client."""
         mock_client = MagicMock()  # Not spec=AsyncOpenAI
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(
-                message=MagicMock(
-                    content=json.dumps({
-                        "tree": {"component": "Text", "props": {"content": "Hello"}},
-                        "voice_fallback": "Hello",
-                        "purpose": "Greeting",
-                    })
-                )
-            )
-        ]
+        mock_response = make_llm_response(_GREETING_SPEC_JSON)
         mock_client.chat.completions.create.return_value = mock_response
 
         agent = UIGenerationAgent(mock_client, model="test")
@@ -15,6 +15,7 @@ import pytest
 from sage.dialogue.structured_output import UITreeNode
 from sage.orchestration.models import UITreeSpec
 from sage.orchestration.ui_agent import UIGenerationAgent
+from tests.conftest import make_llm_response
 
 
 def flatten_tree(node: UITreeNode) -> list[UITreeNode]:
@@ -64,8 +65,7 @@ class TestSessionCheckInPattern:
     def test_generates_valid_check_in_structure(self, agent, mock_client):
         """Agent generates valid session check-in UI with required elements."""
         # Mock response with required check-in elements
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Session Check-in"},
@@ -101,7 +101,7 @@ class TestSessionCheckInPattern:
             },
             voice_fallback="How are you showing up today? How much time do you have - quick, focused, or a deep dive? And energy-wise, where are you at on a scale of 1-100? Anything on your mind?",
             purpose="Collect session check-in data",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -126,15 +126,14 @@ class TestSessionCheckInPattern:
 
     def test_check_in_voice_fallback_is_conversational(self, agent, mock_client):
         """Check-in voice fallback sounds natural, not robotic."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {}, "children": [
                 {"component": "Slider", "props": {"name": "energy", "label": "Energy"}},
                 {"component": "Button", "props": {"action": "submit", "label": "Go"}},
             ]},
             voice_fallback="How are you showing up today? What's your energy level? Anything on your mind before we begin?",
             purpose="Session check-in",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -158,8 +157,7 @@ class TestPracticeSetupPattern:
 
     def test_generates_valid_practice_setup_structure(self, agent, mock_client):
         """Agent generates valid practice setup UI with scenario options."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Practice Scenario"},
@@ -193,7 +191,7 @@ class TestPracticeSetupPattern:
             },
             voice_fallback="Let's practice! Would you like to work on a pricing call, negotiation, presentation, interview, or something custom? Just tell me what situation you'd like to practice.",
             purpose="Set up practice scenario",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -214,8 +212,7 @@ class TestPracticeSetupPattern:
 
     def test_practice_setup_includes_custom_option(self, agent, mock_client):
         """Practice setup allows custom scenario input."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Stack",
                 "props": {},
@@ -230,7 +227,7 @@ class TestPracticeSetupPattern:
             },
             voice_fallback="What situation would you like to practice? Pricing, or describe your own scenario.",
             purpose="Practice setup",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -248,8 +245,7 @@ class TestVerificationChallengePattern:
 
     def test_generates_multiple_choice_verification(self, agent, mock_client):
         """Agent generates valid multiple choice verification quiz."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Quick Check", "variant": "highlight"},
@@ -275,7 +271,7 @@ class TestVerificationChallengePattern:
             },
             voice_fallback="Quick check: you mentioned anchor pricing. What's the key to making it work? A: Start low and negotiate up, B: Start high with room to come down, or C: Match competitor pricing?",
             purpose="Verify understanding of anchor pricing",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -296,8 +292,7 @@ class TestVerificationChallengePattern:
 
     def test_generates_explanation_verification(self, agent, mock_client):
         """Agent generates explanation-type verification challenge."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Explain This"},
@@ -309,7 +304,7 @@ class TestVerificationChallengePattern:
             },
             voice_fallback="Let's see if this landed. Can you explain anchor pricing in your own words?",
             purpose="Explanation verification",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -329,8 +324,7 @@ class TestApplicationEventPattern:
 
     def test_generates_application_capture_ui(self, agent, mock_client):
         """Agent generates UI to capture application event."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Upcoming Application"},
@@ -345,7 +339,7 @@ class TestApplicationEventPattern:
             },
             voice_fallback="I heard you mention you're applying anchor pricing in a call tomorrow. Want me to check in with you after to see how it went?",
             purpose="Capture application event",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -361,8 +355,7 @@ class TestApplicationEventPattern:
 
     def test_generates_application_followup_ui(self, agent, mock_client):
         """Agent generates UI for application followup."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "How did it go?"},
@@ -379,7 +372,7 @@ class TestApplicationEventPattern:
             },
             voice_fallback="Before we dive in - you had that pricing call yesterday. How did it go? Did it go well, were there struggles, or mixed results?",
             purpose="Follow up on application event",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -399,8 +392,7 @@ class TestProofAcknowledgmentPattern:
 
     def test_generates_proof_acknowledgment_ui(self, agent, mock_client):
         """Agent generates celebratory proof acknowledgment UI."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Understanding Verified", "variant": "highlight"},
@@ -416,7 +408,7 @@ class TestProofAcknowledgmentPattern:
             },
             voice_fallback="That's it. You've definitely got anchor pricing. I can tell because you explained it with a real-world example. This one's solid.",
             purpose="Acknowledge proof earned",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -441,8 +433,7 @@ class TestOutcomeDiscoveryPattern:
 
     def test_generates_outcome_discovery_ui(self, agent, mock_client):
         """Agent generates outcome discovery UI."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "What's Your Goal?"},
@@ -457,7 +448,7 @@ class TestOutcomeDiscoveryPattern:
             },
             voice_fallback="What do you want to be able to DO after we're done? Something concrete - not just learn about, but actually do.",
             purpose="Discover learning outcome",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(
@@ -482,14 +473,13 @@ class TestVoiceFallbackQuality:
 
     def test_voice_fallback_is_not_empty(self, agent, mock_client):
         """Voice fallbacks are never empty."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {}, "children": [
                 {"component": "Button", "props": {"action": "test", "label": "Test"}},
             ]},
             voice_fallback="Here's a simple card with a test button.",
             purpose="Test",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Test purpose", context={})
@@ -499,15 +489,14 @@ class TestVoiceFallbackQuality:
 
     def test_voice_fallback_minimum_length(self, agent, mock_client):
         """Voice fallbacks have meaningful content (>20 chars)."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {}, "children": [
                 {"component": "TextInput", "props": {"name": "test", "label": "Test"}},
                 {"component": "Button", "props": {"action": "submit", "label": "Submit"}},
             ]},
             voice_fallback="Please tell me about your situation so I can help you better with this.",
             purpose="Collect information",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Collect information", context={})
@@ -516,15 +505,14 @@ class TestVoiceFallbackQuality:
 
     def test_voice_fallback_is_conversational(self, agent, mock_client):
         """Voice fallbacks use natural language."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Stack", "props": {}, "children": [
                 {"component": "Slider", "props": {"name": "value", "label": "Value"}},
                 {"component": "Button", "props": {"action": "confirm", "label": "Confirm"}},
             ]},
             voice_fallback="How would you rate this on a scale of 1 to 10? Just give me a number when you're ready.",
             purpose="Rating input",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Get rating input", context={})
@@ -536,15 +524,14 @@ class TestVoiceFallbackQuality:
 
     def test_voice_fallback_avoids_form_language(self, agent, mock_client):
         """Voice fallbacks don't use form/UI terminology."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {}, "children": [
                 {"component": "TextInput", "props": {"name": "name", "label": "Name"}},
                 {"component": "Button", "props": {"action": "save", "label": "Save"}},
             ]},
             voice_fallback="What's your name? Just tell me and we can continue.",
             purpose="Collect name",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Collect name input", context={})
@@ -562,15 +549,14 @@ class TestEdgeCases:
 
     def test_handles_missing_context(self, agent, mock_client):
         """Agent handles missing context gracefully."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {}, "children": [
                 {"component": "Text", "props": {"content": "How can I help you today?"}},
                 {"component": "Button", "props": {"action": "start", "label": "Start"}},
             ]},
             voice_fallback="How can I help you today?",
             purpose="General start",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         # Should not raise even with no context
@@ -581,12 +567,11 @@ class TestEdgeCases:
 
     def test_handles_empty_context(self, agent, mock_client):
         """Agent handles empty context dict."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Text", "props": {"content": "Ready to help"}},
             voice_fallback="Ready to help. What would you like to work on?",
             purpose="Ready state",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="General UI", context={})
@@ -595,8 +580,7 @@ class TestEdgeCases:
 
     def test_generates_estimated_interaction_time(self, agent, mock_client):
         """UI specs include estimated interaction time."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Card",
                 "props": {"title": "Complex Form"},
@@ -609,7 +593,7 @@ class TestEdgeCases:
             },
             voice_fallback="I need a few pieces of information from you.",
             purpose="Complex data collection",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Complex form", context={})
@@ -623,12 +607,11 @@ class TestUITreeStructure:
 
     def test_tree_is_valid_uitreenode(self, agent, mock_client):
         """Generated tree is a valid UITreeNode."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={"component": "Card", "props": {"title": "Test"}},
             voice_fallback="Test UI",
             purpose="Test",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Test", context={})
@@ -638,8 +621,7 @@ class TestUITreeStructure:
 
     def test_nested_children_are_valid(self, agent, mock_client):
         """Nested children in tree are valid UITreeNodes."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Stack",
                 "props": {},
@@ -656,7 +638,7 @@ class TestUITreeStructure:
             },
             voice_fallback="Hello with nested button",
             purpose="Nested structure test",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Nested test", context={})
@@ -668,8 +650,7 @@ class TestUITreeStructure:
 
     def test_buttons_have_actions(self, agent, mock_client):
         """All buttons in generated UI have action props."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Stack",
                 "props": {},
@@ -680,7 +661,7 @@ class TestUITreeStructure:
             },
             voice_fallback="Choose primary or secondary action",
             purpose="Multiple buttons",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Multiple buttons", context={})
@@ -692,8 +673,7 @@ class TestUITreeStructure:
 
     def test_inputs_have_names(self, agent, mock_client):
         """All input components have name props for form data."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content=create_mock_ui_response(
+        mock_response = make_llm_response(create_mock_ui_response(
             tree_data={
                 "component": "Stack",
                 "props": {},
@@ -705,7 +685,7 @@ class TestUITreeStructure:
             },
             voice_fallback="Enter your username, rating, and any comments",
             purpose="Form with multiple inputs",
-        )))]
+        ))
         mock_client.chat.completions.create.return_value = mock_response
 
         result = agent.generate(purpose="Form inputs", context={})
@@ -13,16 +13,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from sage.orchestration.ui_agent import UIGenerationAgent
-
-
-def measure_p95_latency_ms(func: Callable, iterations: int) -> float:
-    """Measure P95 latency of a function in milliseconds."""
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        times.append((time.perf_counter() - start) * 1000)
-    return sorted(times)[int(len(times) * 0.95)]
+from tests.conftest import measure_p95_latency_ms
 
 
 def measure_avg_latency_ms(func: Callable, iterations: int) -> float:
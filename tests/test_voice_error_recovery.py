@@ -7,16 +7,13 @@ These tests verify backend support for error scenarios.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
-from sage.api.main import app
-
 
 @pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+def client(shared_client):
+    """Reuse the session-wide test client (these tests need no overrides)."""
+    return shared_client
 
 
 class TestVoiceEndpointErrors: